@@ -1,13 +1,51 @@
+import subprocess
+import sys
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Tuple
 
 
 class Builder(ABC):
+    # build_path should be absolute; builders pass it as cwd to the
+    # subprocesses they spawn, which would otherwise re-resolve it.
     def __init__(self, build_path: str, flavor: Optional[str] = None) -> None:
         self.build_path = build_path
         self.flavor = flavor
         pass
 
+    def _run_streaming(
+        self, cmd: List[str], cwd: Optional[str] = None
+    ) -> Tuple[int, str]:
+        """
+        Run a long build command, streaming its output line by line.
+
+        Merging stderr into stdout and draining the pipe on the calling
+        thread keeps verbose Flutter/Gradle/xcodebuild children from
+        blocking once their output exceeds the OS pipe buffer, while the
+        accumulated text stays available for path extraction.
+
+        Args:
+            cmd (List[str]): Command to execute
+            cwd (str, optional): Working directory
+
+        Returns:
+            Tuple[int, str]: (return code, full output)
+        """
+        process = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        lines = []
+        assert process.stdout is not None
+        for line in process.stdout:
+            sys.stdout.write(line)
+            lines.append(line)
+        process.stdout.close()
+        returncode = process.wait()
+        return returncode, "".join(lines)
+
     @abstractmethod
     def build(self) -> Optional[str]:
         """
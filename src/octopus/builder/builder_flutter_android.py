@@ -1,6 +1,5 @@
 import os
 import re
-import subprocess
 from typing import Optional
 from .builder import Builder
 
@@ -20,31 +19,23 @@ class BuilderFutterAndroid(Builder):
         print(
             f"🚀 Building Android project at {self.build_path} with flavor {self.flavor}..."
         )
-        # 현재 작업 디렉토리 저장
-        original_path = os.getcwd()
-
         # 빌드 경로가 존재하는지 확인
         if not os.path.exists(self.build_path):
             raise FileNotFoundError(f"The build path {self.build_path} does not exist.")
 
-        # 빌드 경로로 이동
-        os.chdir(self.build_path)
-        print(f"ℹ️  Changed working build directory to {os.getcwd()}")
-
+        # 프로세스 전역 os.chdir 대신 서브프로세스마다 cwd를 전달
+        # (병렬 빌드 시 다른 빌더의 작업 디렉토리를 바꾸지 않도록)
         # Flutter 빌드 명령어 실행
         output = self.build_flutter(flavor=self.flavor)
         extract_path = self.extract_file_path(output)
         if not extract_path:
             raise ValueError("Failed to extract path from Flutter build output.")
 
-        # 원래 경로로 복원
-        os.chdir(original_path)
-        print(f"ℹ️  Changed working original directory to {os.getcwd()}")
-
         # 빌드 완료 메시지
         print("✅ Flutter Android build completed successfully.")
 
-        return f"{original_path}/{self.build_path}/{extract_path}"
+        # extract_path는 빌드 출력 기준의 상대 경로, build_path는 절대 경로
+        return os.path.join(self.build_path, extract_path)
 
     def build_flutter(self, flavor: str) -> Optional[str]:
         try:
@@ -59,20 +50,15 @@ class BuilderFutterAndroid(Builder):
                 cmd.append(f"--flavor")
                 cmd.append(f"{flavor}")
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-            )
-            stdout = result.stdout
-            stderr = result.stderr
-            full_output = stdout + stderr
-            print(f"{full_output}")
+            # 출력을 스트리밍하면서 수집 (파이프 버퍼 데드락 방지)
+            returncode, full_output = self._run_streaming(cmd, cwd=str(self.build_path))
+            if returncode != 0:
+                print(f"❌ Flutter build failed with exit code {returncode}")
+                return None
             print("✅ Flutter build successfully.")
             return full_output
-        except subprocess.CalledProcessError as e:
-            full_output = e.stdout + e.stderr
-            print(f"❌ Flutter build failed:\n{full_output}")
+        except Exception as e:
+            print(f"❌ Flutter build failed:\n{e}")
             return None
 
     def extract_file_path(self, build_output: str) -> Optional[str]:
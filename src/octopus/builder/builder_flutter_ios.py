@@ -21,19 +21,17 @@ class BuilderFutterIOS(Builder):
         print(
             f"🚀 Building iOS project at {self.build_path} with flavor {self.flavor}..."
         )
-        # 현재 작업 디렉토리 저장
+        # 현재 작업 디렉토리 (fastlane 경로 계산에 사용)
         original_path = os.getcwd()
 
         # 빌드 경로가 존재하는지 확인
         if not os.path.exists(self.build_path):
             raise FileNotFoundError(f"The build path {self.build_path} does not exist.")
 
-        # 빌드 경로로 이동
-        os.chdir(self.build_path)
-        print(f"ℹ️  Changed working build directory to {os.getcwd()}")
-
+        # 프로세스 전역 os.chdir 대신 서브프로세스마다 cwd를 전달
+        # (병렬 빌드 시 다른 빌더의 작업 디렉토리를 바꾸지 않도록)
         # Pod install 실행
-        pod_install_success = self.pod_install(path=os.getcwd())
+        pod_install_success = self.pod_install(path=str(self.build_path))
         if pod_install_success is False:
             raise RuntimeError(
                 "Pod install failed. Please check the output for details."
@@ -57,7 +55,7 @@ class BuilderFutterIOS(Builder):
         # Export iPA
         export_ipa_path = self.export_ipa(
             original_path=original_path,
-            workspace=f"{os.getcwd()}/ios/Runner.xcworkspace",
+            workspace=f"{self.build_path}/ios/Runner.xcworkspace",
             scheme=self.flavor,
             archive_path=xcarchive_path,
             output_directory=f"{os.path.dirname(xcarchive_path)}",
@@ -67,10 +65,6 @@ class BuilderFutterIOS(Builder):
         if not export_ipa_path:
             raise ValueError("Failed to export IPA file.")
 
-        # 원래 경로로 복원
-        os.chdir(original_path)
-        print(f"ℹ️  Changed working original directory to {os.getcwd()}")
-
         # 빌드 완료 메시지
         print("✅ Flutter iOS build completed successfully.")
 
@@ -86,20 +80,15 @@ class BuilderFutterIOS(Builder):
                 cmd.append(f"--flavor")
                 cmd.append(f"{flavor}")
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-            )
-            stdout = result.stdout
-            stderr = result.stderr
-            full_output = stdout + stderr
-            print(f"{full_output}")
+            # 출력을 스트리밍하면서 수집 (파이프 버퍼 데드락 방지)
+            returncode, full_output = self._run_streaming(cmd, cwd=str(self.build_path))
+            if returncode != 0:
+                print(f"❌ Flutter build failed with exit code {returncode}")
+                return None
             print("✅ Flutter build successfully.")
             return full_output
-        except subprocess.CalledProcessError as e:
-            full_output = e.stdout + e.stderr
-            print(f"❌ Flutter build failed:\n{full_output}")
+        except Exception as e:
+            print(f"❌ Flutter build failed:\n{e}")
             return None
 
     def extract_xcarchive_path(self, output) -> Optional[str]:
@@ -215,6 +204,7 @@ class BuilderFutterIOS(Builder):
 
             result = subprocess.run(
                 cmd,
+                cwd=str(self.build_path),
                 capture_output=True,
                 text=True,
                 check=True,
@@ -1,3 +1,4 @@
+import functools
 import os
 import re
 import shutil
@@ -7,6 +8,9 @@ from typing import Optional
 
 from .git_checkout_manager import GitCheckoutManager
 
+# 저장소 URL에서 저장소 이름을 추출하는 패턴 (모듈 로드 시 1회 컴파일)
+_REPO_NAME_RE = re.compile(r"/([^/]+?)(?:\.git)?/?$")
+
 
 class GitManager:
     """Git 저장소를 관리하는 클래스"""
@@ -22,10 +26,12 @@ class GitManager:
         self.repo_url = repo_url
         self.local_path = Path(local_path)
         self.checkout_manager = GitCheckoutManager(self)
+        self._status_cache: Optional[dict] = None
 
     @staticmethod
+    @functools.lru_cache(maxsize=128)
     def get_repo_name(url):
-        match = re.search(r"/([^/]+?)(?:\.git)?/?$", url)
+        match = _REPO_NAME_RE.search(url)
         return match.group(1) if match else None
 
     def _run_command(
@@ -148,6 +154,7 @@ class GitManager:
         Returns:
             bool: Success status
         """
+        self._status_cache = None
         if force_fresh:
             return self.fresh_pull()
 
@@ -228,6 +235,7 @@ class GitManager:
         Returns:
             bool: Success status
         """
+        self._status_cache = None
         return self.checkout_manager.checkout_branch(branch_name, strategy)
 
     def checkout_commit(self, commit_hash: str, strategy: str = "fresh") -> bool:
@@ -243,6 +251,7 @@ class GitManager:
         Returns:
             bool: Success status
         """
+        self._status_cache = None
         return self.checkout_manager.checkout_commit(commit_hash, strategy)
 
     def checkout_tag(self, tag_name: str, strategy: str = "fresh") -> bool:
@@ -258,6 +267,7 @@ class GitManager:
         Returns:
             bool: Success status
         """
+        self._status_cache = None
         return self.checkout_manager.checkout_tag(tag_name, strategy)
 
     def get_branches(self) -> tuple[bool, list]:
@@ -299,17 +309,83 @@ class GitManager:
 
         return True, branches
 
+    def is_clean_on_branch(self, branch_name: str) -> bool:
+        """
+        로컬 체크아웃이 해당 브랜치에 있고 변경 사항이 없는지 확인
+
+        Args:
+            branch_name (str): 확인할 브랜치 이름
+
+        Returns:
+            bool: 해당 브랜치에서 clean 상태면 True
+        """
+        if not self._is_git_repo():
+            return False
+
+        success, current = self._run_command(
+            ["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=str(self.local_path)
+        )
+        if not success or current.strip() != branch_name:
+            return False
+
+        success, porcelain = self._run_command(
+            ["git", "status", "--porcelain"], cwd=str(self.local_path)
+        )
+        return success and not porcelain.strip()
+
+    def is_synced_with_remote(self, branch_name: str) -> bool:
+        """
+        로컬 HEAD가 원격 브랜치의 최신 커밋과 일치하는지 확인 (ls-remote 1회)
+
+        Args:
+            branch_name (str): 확인할 브랜치 이름
+
+        Returns:
+            bool: 원격 최신 커밋과 일치하면 True
+        """
+        head_commit = self.get_head_commit()
+        if head_commit is None:
+            return False
+
+        success, output = self._run_command(
+            ["git", "ls-remote", "origin", f"refs/heads/{branch_name}"],
+            cwd=str(self.local_path),
+        )
+        if not success or not output.strip():
+            return False
+        remote_commit = output.split()[0]
+        return remote_commit == head_commit
+
+    def get_head_commit(self) -> Optional[str]:
+        """
+        현재 체크아웃된 HEAD 커밋 해시 반환
+
+        Returns:
+            Optional[str]: 커밋 해시 (Git 저장소가 아니면 None)
+        """
+        if not self._is_git_repo():
+            return None
+
+        success, output = self._run_command(
+            ["git", "rev-parse", "HEAD"], cwd=str(self.local_path)
+        )
+        return output.strip() if success else None
+
     def get_status(self) -> dict:
         """
-        저장소 상태 정보 반환
+        저장소 상태 정보 반환 (체크아웃 전까지는 인스턴스에 캐시됨)
 
         Returns:
             dict: 상태 정보
         """
+        if self._status_cache is not None:
+            return self._status_cache
+
         status = {
             "local_path_exists": self.local_path.exists(),
             "is_git_repo": False,
             "current_branch": None,
+            "head_commit": None,
             "remote_url": None,
             "branches": None,
             "local_path": str(self.local_path),
@@ -326,6 +402,9 @@ class GitManager:
                 if success:
                     status["current_branch"] = branch.strip()
 
+                # HEAD 커밋 해시
+                status["head_commit"] = self.get_head_commit()
+
                 # 원격 URL 확인
                 success, url = self._run_command(
                     ["git", "remote", "get-url", "origin"], cwd=str(self.local_path)
@@ -338,6 +417,7 @@ class GitManager:
                 if branches_success:
                     status["branches"] = branches
 
+        self._status_cache = status
         return status
 
     def reset_hard(self, target: str = "HEAD") -> bool:
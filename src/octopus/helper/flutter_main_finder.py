@@ -1,8 +1,17 @@
+import mmap
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Tuple, Union
+
+# Directories that never contain project sources; pruned during walks
+_PRUNE_DIRS = {".git", "build", ".dart_tool", "Pods", "node_modules"}
+
+# Files above this size are scanned through mmap instead of read()
+_MMAP_THRESHOLD = 256 * 1024
 
 
 class FlutterMainFinder:
@@ -10,19 +19,35 @@ class FlutterMainFinder:
     A class to find main() functions in Flutter projects
     """
 
-    def __init__(self, search_path: str = ".", recursive_search: bool = True):
+    def __init__(
+        self,
+        search_path: Union[str, os.PathLike] = ".",
+        recursive_search: bool = True,
+        entry_points_only: bool = False,
+        verbose: bool = True,
+    ):
         """
         Initialize FlutterMainFinder
 
         Args:
-            search_path (str): Path to start searching from
+            search_path (str | os.PathLike): Path to start searching from
             recursive_search (bool): Whether to recursively search subdirectories for Flutter projects
+            entry_points_only (bool): Only collect actual Flutter entry points (files with runApp)
+            verbose (bool): Print progress while searching
         """
-        self.search_path = Path(search_path).resolve()
+        # Kept unresolved; resolving costs stat/readlink syscalls that short-lived
+        # instances may never need (see resolved_search_path)
+        self.search_path = Path(search_path)
         self.recursive_search = recursive_search
+        self.entry_points_only = entry_points_only
+        self.verbose = verbose
         self.flutter_projects = []
         self.main_files = []
 
+        # Cache of project path -> Flutter project classification
+        # (avoids re-reading pubspec.yaml during recursive walks)
+        self._flutter_cache: Dict[str, bool] = {}
+
         # Regular expression patterns for finding main() functions
         self.main_patterns = [
             r"void\s+main\s*\(",  # void main(
@@ -36,6 +61,16 @@ class FlutterMainFinder:
             r"flutter\.runApp\s*\(",  # flutter.runApp(
         ]
 
+        # Compiled fallbacks for the rare files where the literal forms don't hit
+        self._main_regexes = [re.compile(p) for p in self.main_patterns]
+        self._runapp_regexes = [re.compile(p) for p in self.runapp_patterns]
+
+        # Byte-pattern variants used when scanning mmap'd large files
+        self._main_regexes_bytes = [re.compile(p.encode()) for p in self.main_patterns]
+        self._runapp_regexes_bytes = [
+            re.compile(p.encode()) for p in self.runapp_patterns
+        ]
+
         # Directories to search in
         self.search_dirs = ["lib", "test"]
 
@@ -52,25 +87,41 @@ class FlutterMainFinder:
             print(f"❌ Search path does not exist: {self.search_path}")
             return flutter_projects
 
-        print("=" * 80)
-        print(f"🔍 Searching for Flutter projects: {self.search_path}")
+        # Batch status output into a single write instead of printing per project
+        status_lines = []
+        if self.verbose:
+            status_lines.append("=" * 80)
+            status_lines.append(
+                f"🔍 Searching for Flutter projects: {self.search_path}"
+            )
 
         if self.recursive_search:
-            # Recursively find pubspec.yaml files
-            for pubspec_file in self.search_path.rglob("pubspec.yaml"):
-                project_path = pubspec_file.parent
+            # Walk without following symlinks (avoids pub-cache/packages symlink
+            # loops) and prune vendored/build directories up front
+            for root, dirs, files in os.walk(self.search_path, followlinks=False):
+                dirs[:] = [d for d in dirs if d not in _PRUNE_DIRS]
+                if "pubspec.yaml" not in files:
+                    continue
+                project_path = Path(root)
 
                 # Check if it's a Flutter project (has flutter dependencies in pubspec.yaml)
                 if self.is_flutter_project_at_path(project_path):
                     flutter_projects.append(project_path)
-                    print(
-                        f"✅ Flutter project found: {project_path.relative_to(self.search_path)}"
-                    )
+                    if self.verbose:
+                        status_lines.append(
+                            f"✅ Flutter project found: {self._relative_str(project_path, self._search_prefix)}"
+                        )
         else:
             # Check only current path
             if self.is_flutter_project_at_path(self.search_path):
                 flutter_projects.append(self.search_path)
-                print(f"✅ Flutter project confirmed: {self.search_path}")
+                if self.verbose:
+                    status_lines.append(
+                        f"✅ Flutter project confirmed: {self.search_path}"
+                    )
+
+        if status_lines:
+            sys.stdout.write("\n".join(status_lines) + "\n")
 
         self.flutter_projects = flutter_projects
         return flutter_projects
@@ -85,8 +136,14 @@ class FlutterMainFinder:
         Returns:
             bool: Whether it's a Flutter project
         """
+        cache_key = str(project_path)
+        cached = self._flutter_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         pubspec_file = project_path / "pubspec.yaml"
         if not pubspec_file.exists():
+            self._flutter_cache[cache_key] = False
             return False
 
         try:
@@ -94,14 +151,17 @@ class FlutterMainFinder:
             with open(pubspec_file, "r", encoding="utf-8") as f:
                 content = f.read().lower()
                 # Check if flutter SDK or flutter dependencies exist
-                return (
+                is_flutter = (
                     "flutter:" in content
                     or "flutter_test:" in content
                     or "sdk: flutter" in content
                 )
         except Exception:
             # If file can't be read, judge by pubspec.yaml existence only
-            return True
+            is_flutter = True
+
+        self._flutter_cache[cache_key] = is_flutter
+        return is_flutter
 
     def validate_search_path(self) -> bool:
         """
@@ -115,6 +175,126 @@ class FlutterMainFinder:
             return False
         return True
 
+    @cached_property
+    def resolved_search_path(self) -> Path:
+        """Canonical form of the search path, resolved on first use"""
+        return self.search_path.resolve()
+
+    @cached_property
+    def _search_prefix(self) -> str:
+        """
+        Prefix for string-based relative paths
+        (Path.relative_to is noticeably slower over thousands of files)
+        """
+        return str(self.search_path) + os.sep
+
+    @staticmethod
+    def _relative_str(path: Path, prefix: str) -> str:
+        """
+        String-based replacement for Path.relative_to
+
+        Args:
+            path (Path): Path to make relative
+            prefix (str): Base directory prefix, ending with os.sep
+
+        Returns:
+            str: Relative path string ("." when path equals the base directory)
+        """
+        s = str(path)
+        if s.startswith(prefix):
+            return s[len(prefix) :]
+        if s == prefix[: -len(os.sep)]:
+            return "."
+        return s
+
+    def _scan_text(self, content: str) -> Optional[Tuple[Optional[str], bool, Optional[str]]]:
+        """
+        Match main()/runApp() patterns in decoded file content
+
+        Literal substring tests cover the common spellings at C speed; the
+        compiled regexes run only when a bare main/runApp token appears with
+        unusual whitespace.
+
+        Returns:
+            Optional[Tuple]: (main_pattern, has_runapp, runapp_pattern) or None
+        """
+        # Fast path: when only entry points are wanted, skip files without
+        # a runApp substring before paying any regex cost
+        if self.entry_points_only and "runApp" not in content:
+            return None
+
+        main_pattern_found = None
+        if "void main(" in content:
+            main_pattern_found = self.main_patterns[0]
+        elif "Future<void> main(" in content:
+            main_pattern_found = self.main_patterns[1]
+        elif "main" in content:
+            for regex in self._main_regexes:
+                if regex.search(content):
+                    main_pattern_found = regex.pattern
+                    break
+
+        if not main_pattern_found:
+            return None
+
+        has_runapp = False
+        runapp_pattern_found = None
+        if "flutter.runApp(" in content:
+            has_runapp = True
+            runapp_pattern_found = self.runapp_patterns[1]
+        elif "runApp(" in content:
+            has_runapp = True
+            runapp_pattern_found = self.runapp_patterns[0]
+        elif "runApp" in content:
+            for regex in self._runapp_regexes:
+                if regex.search(content):
+                    has_runapp = True
+                    runapp_pattern_found = regex.pattern
+                    break
+
+        return main_pattern_found, has_runapp, runapp_pattern_found
+
+    def _scan_bytes(self, buf) -> Optional[Tuple[Optional[str], bool, Optional[str]]]:
+        """
+        Byte-level variant of _scan_text for mmap'd buffers
+
+        Returns:
+            Optional[Tuple]: (main_pattern, has_runapp, runapp_pattern) or None
+        """
+        if self.entry_points_only and buf.find(b"runApp") < 0:
+            return None
+
+        main_pattern_found = None
+        if buf.find(b"void main(") >= 0:
+            main_pattern_found = self.main_patterns[0]
+        elif buf.find(b"Future<void> main(") >= 0:
+            main_pattern_found = self.main_patterns[1]
+        elif buf.find(b"main") >= 0:
+            for regex in self._main_regexes_bytes:
+                if regex.search(buf):
+                    main_pattern_found = regex.pattern.decode()
+                    break
+
+        if not main_pattern_found:
+            return None
+
+        has_runapp = False
+        runapp_pattern_found = None
+        if buf.find(b"flutter.runApp(") >= 0:
+            has_runapp = True
+            runapp_pattern_found = self.runapp_patterns[1]
+        elif buf.find(b"runApp(") >= 0:
+            has_runapp = True
+            runapp_pattern_found = self.runapp_patterns[0]
+        elif buf.find(b"runApp") >= 0:
+            for regex in self._runapp_regexes_bytes:
+                if regex.search(buf):
+                    has_runapp = True
+                    runapp_pattern_found = regex.pattern.decode()
+                    break
+
+        return main_pattern_found, has_runapp, runapp_pattern_found
+
     def search_main_in_file(
         self, dart_file: Path, project_path: Path
     ) -> Optional[Dict]:
@@ -129,40 +309,35 @@ class FlutterMainFinder:
             Optional[Dict]: main() function information or None
         """
         try:
-            with open(dart_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Search for main() function patterns
-            main_pattern_found = None
-            for pattern in self.main_patterns:
-                if re.search(pattern, content):
-                    main_pattern_found = pattern
-                    break
-
-            if not main_pattern_found:
+            # Large (usually generated) files are scanned via mmap so the regex
+            # engine reads the page cache directly instead of a full copy
+            if os.path.getsize(dart_file) > _MMAP_THRESHOLD:
+                with open(dart_file, "rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        matched = self._scan_bytes(mm)
+            else:
+                with open(dart_file, "r", encoding="utf-8") as f:
+                    content = f.read()
+                matched = self._scan_text(content)
+
+            if matched is None:
                 return None
 
-            # Check for runApp() function call
-            has_runapp = False
-            runapp_pattern_found = None
-            for pattern in self.runapp_patterns:
-                if re.search(pattern, content):
-                    has_runapp = True
-                    runapp_pattern_found = pattern
-                    break
+            main_pattern_found, has_runapp, runapp_pattern_found = matched
 
-            relative_to_search = dart_file.relative_to(self.search_path)
-            relative_to_project = dart_file.relative_to(project_path)
+            relative_to_search = self._relative_str(dart_file, self._search_prefix)
+            relative_to_project = self._relative_str(
+                dart_file, str(project_path) + os.sep
+            )
 
             return {
-                "file": str(relative_to_search),
-                "project_file": str(relative_to_project),
+                "file": relative_to_search,
+                "project_file": relative_to_project,
                 "project_path": str(project_path),
                 "absolute_path": str(dart_file),
                 "main_pattern_matched": main_pattern_found,
                 "has_runapp": has_runapp,
                 "runapp_pattern_matched": runapp_pattern_found,
-                "content": content,
                 "is_flutter_entry_point": has_runapp,  # If runApp exists, it's an actual Flutter entry point
             }
 
@@ -171,51 +346,139 @@ class FlutterMainFinder:
 
         return None
 
-    def find_main_functions(self) -> List[Dict]:
+    @staticmethod
+    def _scan_dart_files(dir_path: Path) -> List[Path]:
         """
-        Search for all main() functions in Flutter projects
+        Collect .dart files under dir_path with an explicit scandir stack
+
+        os.scandir reports entry types from the dirent, so descending
+        does not cost a stat per entry the way rglob does; generated
+        and vendored directories are pruned like the project walk.
+
+        Args:
+            dir_path (Path): Directory to scan
 
         Returns:
-            List[Dict]: List of file information containing main() functions
+            List[Path]: Discovered .dart files
+        """
+        dart_files = []
+        stack = [dir_path]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _PRUNE_DIRS:
+                                stack.append(Path(entry.path))
+                        elif entry.name.endswith(".dart"):
+                            dart_files.append(Path(entry.path))
+            except OSError:
+                continue
+        return dart_files
+
+    def iter_main_functions(self) -> Iterator[Dict]:
+        """
+        Search for main() functions and yield results as they are discovered
+
+        Streaming lets the caller overlap downstream work with the remaining
+        scan instead of waiting for the whole tree. Does not populate
+        self.main_files; use find_main_functions for the list form.
+
+        Yields:
+            Dict: File information for each main() function found
         """
         if not self.validate_search_path():
-            return []
+            return
 
         # Find Flutter projects
         flutter_projects = self.find_flutter_projects()
 
         if not flutter_projects:
             print("❌ No Flutter projects found.")
-            return []
-
-        self.main_files = []
+            return
 
         # Search for main() functions in each Flutter project
         for project_path in flutter_projects:
-            print(
-                f"🔍 Searching for main() functions in {project_path.relative_to(self.search_path)}..."
-            )
+            # Batch per-file status output into one write per project
+            status_lines = []
+            if self.verbose:
+                status_lines.append(
+                    f"🔍 Searching for main() functions in {self._relative_str(project_path, self._search_prefix)}..."
+                )
 
-            # Search .dart files in each search directory
+            # Collect .dart files from each search directory first
+            dart_files = []
             for search_dir in self.search_dirs:
                 dir_path = project_path / search_dir
                 if not dir_path.exists():
                     continue
 
-                # Recursively search .dart files
-                for dart_file in dir_path.rglob("*.dart"):
-                    main_info = self.search_main_in_file(dart_file, project_path)
+                # Recursively collect .dart files
+                dart_files.extend(self._scan_dart_files(dir_path))
+
+            if not dart_files:
+                if status_lines:
+                    sys.stdout.write("\n".join(status_lines) + "\n")
+                continue
+
+            # Scan files in parallel (open+read+regex is I/O-bound and independent per file)
+            max_workers = min(32, (os.cpu_count() or 4) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self.search_main_in_file, dart_file, project_path)
+                    for dart_file in dart_files
+                ]
+                # Collect in submission order: results stay deterministic
+                # (callers pick entry_points[0]) and throughput is the same
+                # since every future must finish before the pool exits anyway
+                for future in futures:
+                    main_info = future.result()
                     if main_info:
-                        self.main_files.append(main_info)
-                        entry_type = (
-                            "Flutter app entry point"
-                            if main_info["has_runapp"]
-                            else "main() function"
-                        )
-                        print(f"✅ {entry_type} found: {main_info['file']}")
+                        if self.verbose:
+                            entry_type = (
+                                "Flutter app entry point"
+                                if main_info["has_runapp"]
+                                else "main() function"
+                            )
+                            status_lines.append(
+                                f"✅ {entry_type} found: {main_info['file']}"
+                            )
+                        yield main_info
+
+            if status_lines:
+                sys.stdout.write("\n".join(status_lines) + "\n")
+
+    def find_main_functions(self) -> List[Dict]:
+        """
+        Search for all main() functions in Flutter projects
 
+        Returns:
+            List[Dict]: List of file information containing main() functions
+        """
+        self.main_files = list(self.iter_main_functions())
         return self.main_files
 
+    def get_content(self, entry: Dict) -> Optional[str]:
+        """
+        Read the file content for a search result on demand
+
+        The content is not kept in the result dicts to avoid pinning every
+        scanned file's text in memory; re-read it here when actually needed.
+
+        Args:
+            entry (Dict): A result dict from search_main_in_file
+
+        Returns:
+            Optional[str]: File content or None if it can't be read
+        """
+        try:
+            with open(entry["absolute_path"], "r", encoding="utf-8") as f:
+                return f.read()
+        except Exception as e:
+            print(f"⚠️  File reading error {entry['absolute_path']}: {e}")
+            return None
+
     def get_flutter_entry_points(self) -> List[Dict]:
         """
         Return only actual Flutter app entry points (main() functions with runApp)
@@ -1,6 +1,8 @@
-import os
+import random
+import shutil
 import subprocess
 import time
+from functools import cached_property
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -8,6 +10,10 @@ from typing import Optional, Tuple
 class FlutterMelosChecker:
     """Class to check for melos.yaml file existence in Flutter projects"""
 
+    # Recognized melos config filenames; class-level so callers can probe
+    # for a config without constructing a checker
+    melos_files = ["melos.yaml", "melos.yml"]
+
     def __init__(self, project_path: str = "."):
         """
         Initialize FlutterMelosChecker
@@ -15,8 +21,15 @@ class FlutterMelosChecker:
         Args:
             project_path (str): Project path (default: current directory)
         """
-        self.project_path = Path(project_path).resolve()
-        self.melos_files = ["melos.yaml", "melos.yml"]
+        # Kept unresolved; resolving costs stat/readlink syscalls that callers
+        # doing a quick config check never need (see resolved_project_path)
+        self.project_path = Path(project_path)
+        self._melos_path: Optional[str] = None
+
+    @cached_property
+    def resolved_project_path(self) -> Path:
+        """Canonical form of the project path, resolved on first use"""
+        return self.project_path.resolve()
 
     def has_melos_config(self) -> bool:
         """
@@ -45,8 +58,11 @@ class FlutterMelosChecker:
             bool: True if should retry, False if should stop
         """
         if attempt < max_retries - 1:
-            print(f"{error_msg}\n⏳ Retrying in 2 seconds...")
-            time.sleep(2)
+            # Exponential backoff with jitter so parallel CI jobs don't retry in sync
+            base = 1.0
+            delay = min(30, base * (2**attempt)) + random.uniform(0, base)
+            print(f"{error_msg}\n⏳ Retrying in {delay:.1f} seconds...")
+            time.sleep(delay)
             return True
         else:
             final_msg = f"{error_msg}\n💥 Failed after {max_retries} attempts"
@@ -74,10 +90,10 @@ class FlutterMelosChecker:
             )
 
         # Non-retryable errors
-        try:
-            # Check if melos command exists first
-            subprocess.run(["melos", "--version"], capture_output=True, timeout=10)
-        except FileNotFoundError:
+        # Check if melos command exists first (PATH lookup, no subprocess spawn)
+        if self._melos_path is None:
+            self._melos_path = shutil.which("melos")
+        if self._melos_path is None:
             not_found_msg = "❌ Melos command not found. Please install melos first:\n💡 dart pub global activate melos"
             print(not_found_msg)
             return False, not_found_msg
@@ -91,18 +107,19 @@ class FlutterMelosChecker:
                     print(f"🔄 Retry attempt {attempt} of {max_retries - 1}...")
 
                 # Execute melos bootstrap command
+                # verbose: inherit stdout so output streams in real time
+                # quiet: discard stdout instead of buffering it, keep stderr for error reporting
                 result = subprocess.run(
                     ["melos", "bootstrap"],
                     cwd=self.project_path,
-                    capture_output=not verbose,
+                    stdout=None if verbose else subprocess.DEVNULL,
+                    stderr=None if verbose else subprocess.PIPE,
                     text=True,
                     timeout=300,  # 5 minutes timeout
                 )
 
                 if result.returncode == 0:
                     success_msg = "✅ Melos bootstrap completed successfully!"
-                    if verbose and result.stdout:
-                        success_msg += f"\n📄 Output:\n{result.stdout}"
                     if attempt > 0:
                         success_msg += f"\n🎯 Succeeded after {attempt + 1} attempts"
                     print(success_msg)
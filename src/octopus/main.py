@@ -1,16 +1,21 @@
 import argparse
+import functools
+import os
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
-from .builder import BuilderFutterIOS, BuilderFutterAndroid
-from .deploy import DeployAppStore, DeployGooglePlayStore, FastlaneRelease
-from .git import GitManager
-from .helper import FlutterMainFinder, FlutterMelosChecker
+# Heavy submodules are imported lazily inside build()/deployment() so that
+# --help and argparse error paths exit without paying their import cost.
+if TYPE_CHECKING:
+    from .deploy import FastlaneRelease
 
+# Where repositories are cloned and where the entry-point cache lives
+REPO_ROOT = Path("./repo")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True, kw_only=True)
 class BuildConfig:
     """Build configuration parameters for the application build process."""
 
@@ -23,26 +28,20 @@ class BuildConfig:
     commit_hash: Optional[str] = None
     tag_name: Optional[str] = None
     strategy: Optional[str] = "fresh"
+    use_appbundle: bool = True
 
 
-@dataclass
-class DeployConfig:
-    """Deployment configuration parameters for the application deployment process."""
+@dataclass(slots=True, frozen=True, kw_only=True)
+class DeployConfig(BuildConfig):
+    """Deployment configuration parameters for the application deployment process.
 
-    # Build configuration (embedded from BuildConfig)
-    platform: str
-    framework: str
-    git_url: str
-    flavor: Optional[str] = None
-    provisioning_profile: Optional[str] = None
-    branch: Optional[str] = None
-    commit_hash: Optional[str] = None
-    tag_name: Optional[str] = None
-    strategy: Optional[str] = "fresh"
+    Inherits the build configuration fields from BuildConfig, so a
+    DeployConfig can be passed to build() directly without copying.
+    """
 
     # Deployment specific
     build_file_path: Optional[str] = None
-    lane: Optional[FastlaneRelease] = None
+    lane: Optional["FastlaneRelease"] = None
 
     # iOS specific parameters
     ios_api_key_id: Optional[str] = None
@@ -57,268 +56,404 @@ class DeployConfig:
     # Common parameters
     release_notes: Optional[Dict[str, str]] = None
 
-    def get_build_config(self) -> BuildConfig:
-        """Extract BuildConfig from this DeployConfig."""
-        return BuildConfig(
-            platform=self.platform,
-            framework=self.framework,
-            git_url=self.git_url,
-            flavor=self.flavor,
-            provisioning_profile=self.provisioning_profile,
-            branch=self.branch,
-            commit_hash=self.commit_hash,
-            tag_name=self.tag_name,
-            strategy=self.strategy,
-        )
 
+# Converts the --lane value to its FastlaneRelease member at parse time,
+# so command() doesn't need a post-parse mapping dict. Defined once at module
+# scope so the cached parser holds a single reusable callable.
+def _lane(value: str) -> "FastlaneRelease":
+    from .deploy import FastlaneRelease
 
-# Main entry point for the Octopus CI/CD tool.
-def command() -> None:
-    parser = argparse.ArgumentParser(
-        description="iOS/Android CI/CD Tool",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""""",
-    )
+    try:
+        return FastlaneRelease(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid lane: {value!r} (choose from internal_release, production_release)"
+        )
 
-    # Create subparsers for different commands
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-    subparsers.required = True
 
-    # Build command
-    build_parser = subparsers.add_parser("build", help="Build the application")
-    build_parser.add_argument(
-        "--framework",
-        type=str,
-        required=True,
-        help="Framework to use for the build",
-        choices=["flutter"],
-    )
-    build_parser.add_argument(
-        "--platform",
-        type=str,
-        required=True,
-        help="Platform to build for (ios/android)",
-        choices=["ios", "android"],
-    )
-    build_parser.add_argument(
-        "--git",
-        type=str,
-        required=True,
-        help="Git repository URL",
-    )
-    build_parser.add_argument(
-        "--flavor",
-        type=str,
-        help="Flavor of the build (optional)",
-    )
-    build_parser.add_argument(
-        "--provisioning-profile",
-        type=str,
-        help="Provisioning profile for iOS builds (optional)",
-    )
-    build_parser.add_argument(
-        "--branch",
-        type=str,
-        help="Git branch to checkout (optional, default: main)",
-    )
-    build_parser.add_argument(
-        "--commit-hash",
-        type=str,
-        help="Git commit hash to checkout (optional)",
-    )
-    build_parser.add_argument(
-        "--tag-name",
-        type=str,
-        help="Git tag name to checkout (optional)",
-    )
-    build_parser.add_argument(
-        "--strategy",
-        type=str,
-        default="fresh",
-        help="Git clone to strategy (optional, default: fresh)",
+# Validates and normalizes the --platform value, which may name several
+# comma-separated platforms (e.g. "ios,android") for a dual-target build.
+def _platforms(value: str) -> str:
+    # dict.fromkeys dedupes while keeping order, so "ios,ios" cannot
+    # launch two identical builds in the same directory
+    parts = list(
+        dict.fromkeys(part.strip() for part in value.split(",") if part.strip())
     )
+    if not parts:
+        raise argparse.ArgumentTypeError("at least one platform is required")
+    for part in parts:
+        if part not in ("ios", "android"):
+            raise argparse.ArgumentTypeError(
+                f"invalid platform: {part!r} (choose from ios, android)"
+            )
+    return ",".join(parts)
 
-    # Deploy command
-    deploy_parser = subparsers.add_parser("deploy", help="Deploy the application")
 
-    # Build configuration parameters
-    deploy_parser.add_argument(
+# Option registries: each parser option is declared once as (flag, kwargs)
+# and applied by _apply(), instead of repeating add_argument blocks per
+# subparser. _BUILD_OPTS is shared by the build and deploy commands.
+_BUILD_OPTS = (
+    (
         "--framework",
-        type=str,
-        required=True,
-        help="Framework to use for the build",
-        choices=["flutter"],
-    )
-    deploy_parser.add_argument(
+        dict(
+            type=str,
+            required=True,
+            help="Framework to use for the build",
+            choices=["flutter"],
+        ),
+    ),
+    (
         "--platform",
-        type=str,
-        required=True,
-        help="Platform to build for (ios/android)",
-        choices=["ios", "android"],
-    )
-    deploy_parser.add_argument(
+        dict(
+            type=_platforms,
+            required=True,
+            help="Platform(s) to build for: ios, android, or ios,android",
+            metavar="PLATFORM[,PLATFORM]",
+        ),
+    ),
+    (
         "--git",
-        type=str,
-        required=True,
-        help="Git repository URL",
-    )
-    deploy_parser.add_argument(
+        dict(
+            dest="git_url",
+            type=str,
+            required=True,
+            help="Git repository URL",
+        ),
+    ),
+    (
         "--flavor",
-        type=str,
-        help="Flavor of the build (optional)",
-    )
-    deploy_parser.add_argument(
+        dict(
+            type=str,
+            help="Flavor of the build (optional)",
+        ),
+    ),
+    (
         "--provisioning-profile",
-        type=str,
-        help="Provisioning profile for iOS builds (optional)",
-    )
-    deploy_parser.add_argument(
+        dict(
+            type=str,
+            help="Provisioning profile for iOS builds (optional)",
+        ),
+    ),
+    (
         "--branch",
-        type=str,
-        help="Git branch to checkout (optional, default: main)",
-    )
-    deploy_parser.add_argument(
+        dict(
+            type=str,
+            help="Git branch to checkout (optional, default: main)",
+        ),
+    ),
+    (
         "--commit-hash",
-        type=str,
-        help="Git commit hash to checkout (optional)",
-    )
-    deploy_parser.add_argument(
+        dict(
+            type=str,
+            help="Git commit hash to checkout (optional)",
+        ),
+    ),
+    (
         "--tag-name",
-        type=str,
-        help="Git tag name to checkout (optional)",
-    )
-    deploy_parser.add_argument(
+        dict(
+            type=str,
+            help="Git tag name to checkout (optional)",
+        ),
+    ),
+    (
         "--strategy",
-        type=str,
-        default="fresh",
-        help="Git clone to strategy (optional, default: fresh)",
-    )
-
+        dict(
+            type=str,
+            default="fresh",
+            help="Git clone to strategy (optional, default: fresh)",
+        ),
+    ),
+    (
+        "--android-use-appbundle",
+        dict(
+            dest="use_appbundle",
+            action=argparse.BooleanOptionalAction,
+            default=True,
+            help="Build an .aab instead of an .apk for Android (default: true)",
+        ),
+    ),
+    (
+        "--json",
+        dict(
+            action="store_true",
+            help="Write a single-line JSON result to stdout (human output goes to stderr)",
+        ),
+    ),
+)
+
+# Deployment-specific options for the deploy command.
+_DEPLOY_OPTS = (
     # Common parameters for both iOS and Android
-    deploy_parser.add_argument(
+    (
         "--build-file-path",
-        type=str,
-        help="Path to the build file (.ipa, .apk, or .aab). If not provided, will build from source.",
-    )
-    deploy_parser.add_argument(
+        dict(
+            type=str,
+            help="Path to the build file (.ipa, .apk, or .aab). If not provided, will build from source.",
+        ),
+    ),
+    (
         "--lane",
-        type=str,
-        required=True,
-        help="Fastlane lane to use",
-        choices=["internal_release", "production_release"],
-    )
-    deploy_parser.add_argument(
+        dict(
+            type=_lane,
+            required=True,
+            metavar="{internal_release,production_release}",
+            help="Fastlane lane to use",
+        ),
+    ),
+    (
         "--release-notes",
-        type=str,
-        help='Release notes as JSON string (e.g., \'{"ko":"Korean notes","en-US":"English notes"}\')',
-    )
-
+        dict(
+            type=str,
+            help='Release notes as JSON string (e.g., \'{"ko":"Korean notes","en-US":"English notes"}\')',
+        ),
+    ),
     # iOS specific parameters
-    deploy_parser.add_argument(
+    (
         "--ios-api-key-id",
-        type=str,
-        help="iOS App Store Connect API Key ID (required for iOS)",
-    )
-    deploy_parser.add_argument(
+        dict(
+            type=str,
+            help="iOS App Store Connect API Key ID (required for iOS)",
+        ),
+    ),
+    (
         "--ios-api-key-issuer-id",
-        type=str,
-        help="iOS App Store Connect API Key Issuer ID (required for iOS)",
-    )
-    deploy_parser.add_argument(
+        dict(
+            type=str,
+            help="iOS App Store Connect API Key Issuer ID (required for iOS)",
+        ),
+    ),
+    (
         "--ios-api-key-path",
-        type=str,
-        help="iOS App Store Connect API Key file path (required for iOS)",
-    )
-    deploy_parser.add_argument(
+        dict(
+            type=str,
+            help="iOS App Store Connect API Key file path (required for iOS)",
+        ),
+    ),
+    (
         "--ios-groups",
-        type=str,
-        help="iOS groups to deploy to (optional)",
-    )
-
+        dict(
+            type=str,
+            help="iOS groups to deploy to (optional)",
+        ),
+    ),
     # Android specific parameters
-    deploy_parser.add_argument(
+    (
         "--android-json-key-path",
-        type=str,
-        help="Android JSON key file path (required for Android)",
-    )
-    deploy_parser.add_argument(
+        dict(
+            type=str,
+            help="Android JSON key file path (required for Android)",
+        ),
+    ),
+    (
         "--android-package-name",
-        type=str,
-        help="Android package name (required for Android)",
+        dict(
+            type=str,
+            help="Android package name (required for Android)",
+        ),
+    ),
+)
+
+
+def _apply(parser: argparse.ArgumentParser, opts) -> None:
+    for flag, kwargs in opts:
+        parser.add_argument(flag, **kwargs)
+
+
+# Maps "--flag" -> (dest, kwargs) for the fast scanner below, derived from
+# the same registries argparse uses so the two parsers cannot drift.
+def _opt_table(opts) -> Dict[str, tuple]:
+    table = {}
+    for flag, kwargs in opts:
+        dest = kwargs.get("dest", flag[2:].replace("-", "_"))
+        table[flag] = (dest, kwargs)
+        if kwargs.get("action") is argparse.BooleanOptionalAction:
+            table["--no-" + flag[2:]] = (dest, kwargs)
+    return table
+
+
+# Linear-time alternative to argparse for scripted callers that invoke
+# command() in a tight loop (argparse's option scan is quadratic in the
+# option count). Opt-in via OCTOPUS_FAST_CLI=1; returns None on anything
+# it does not recognize so the caller falls back to argparse, which keeps
+# help/usage/error text in one place.
+def _fast_parse(argv) -> Optional[argparse.Namespace]:
+    if not argv or argv[0] not in ("build", "deploy"):
+        return None
+    cmd = argv[0]
+    opts = _BUILD_OPTS if cmd == "build" else _BUILD_OPTS + _DEPLOY_OPTS
+    table = _opt_table(opts)
+
+    values = {
+        dest: kwargs.get("default", False if kwargs.get("action") == "store_true" else None)
+        for dest, kwargs in table.values()
+    }
+    seen = set()
+    i = 1
+    while i < len(argv):
+        token = argv[i]
+        flag, eq, inline = token.partition("=")
+        entry = table.get(flag)
+        if entry is None:
+            return None
+        dest, kwargs = entry
+        action = kwargs.get("action")
+        if action == "store_true":
+            if eq:
+                return None
+            values[dest] = True
+            i += 1
+        elif action is argparse.BooleanOptionalAction:
+            if eq:
+                return None
+            values[dest] = not flag.startswith("--no-")
+            i += 1
+        else:
+            if eq:
+                raw = inline
+            elif i + 1 < len(argv) and not argv[i + 1].startswith("--"):
+                raw = argv[i + 1]
+                i += 1
+            else:
+                # Missing value (or the next token is another flag):
+                # let argparse own the error reporting
+                return None
+            converter = kwargs.get("type", str)
+            try:
+                value = converter(raw)
+            except (ValueError, argparse.ArgumentTypeError):
+                return None
+            choices = kwargs.get("choices")
+            if choices is not None and value not in choices:
+                return None
+            values[dest] = value
+            i += 1
+        seen.add(dest)
+
+    for dest, kwargs in table.values():
+        if kwargs.get("required") and dest not in seen:
+            return None
+
+    return argparse.Namespace(command=cmd, **values)
+
+
+# Builds the CLI parser once; cached so re-entrant callers (tests, embedding)
+# skip the repeated subparser/add_argument setup.
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="iOS/Android CI/CD Tool",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""""",
     )
 
-    args = parser.parse_args()
+    # Create subparsers for different commands
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    subparsers.required = True
+
+    # Build command
+    build_parser = subparsers.add_parser("build", help="Build the application")
+    _apply(build_parser, _BUILD_OPTS)
+
+    # Deploy command (shares the build configuration options)
+    deploy_parser = subparsers.add_parser("deploy", help="Deploy the application")
+    _apply(deploy_parser, _BUILD_OPTS + _DEPLOY_OPTS)
+
+    return parser
+
+
+# Main entry point for the Octopus CI/CD tool.
+def command() -> None:
+    import sys
+
+    args = None
+    if os.environ.get("OCTOPUS_FAST_CLI") == "1":
+        args = _fast_parse(sys.argv[1:])
+    if args is None:
+        args = _build_parser().parse_args()
 
     if args.command == "build":
+        # Option dests match the dataclass field names (--git maps to
+        # git_url), so the config is built straight from the fields.
         config = BuildConfig(
-            platform=args.platform,
-            framework=args.framework,
-            git_url=args.git,
-            flavor=args.flavor if args.flavor else None,
-            provisioning_profile=(
-                args.provisioning_profile if args.provisioning_profile else None
-            ),
-            branch=args.branch if args.branch else None,
-            commit_hash=args.commit_hash if args.commit_hash else None,
-            tag_name=args.tag_name if args.tag_name else None,
-            strategy=args.strategy,
+            **{f.name: getattr(args, f.name) for f in fields(BuildConfig)}
         )
-        result = build(config)
-        if result:
-            print(f"✅ Build completed successfully: {result}")
+        if args.json:
+            import contextlib
+            import json
+
+            # Keep stdout clean for the JSON blob; the pipeline's progress
+            # output is redirected to stderr for the duration of the build.
+            with contextlib.redirect_stdout(sys.stderr):
+                result = build(config)
+            # Always emit a result object, success or not, so matrix
+            # parsers see the same shape as the deploy path
+            sys.stdout.write(
+                json.dumps({"output": result, "platform": config.platform}) + "\n"
+            )
+            if result:
+                print("✅ Build completed successfully", file=sys.stderr)
+            else:
+                print("❌ Build failed", file=sys.stderr)
+                sys.exit(1)
         else:
-            print("❌ Build failed")
+            result = build(config)
+            if result:
+                print(f"✅ Build completed successfully: {result}")
+            else:
+                print("❌ Build failed", file=sys.stderr)
+                sys.exit(1)
 
     elif args.command == "deploy":
         # Parse release notes if provided
         release_notes_dict = None
         if args.release_notes:
+            # Prefer orjson (C implementation) when installed; both accept
+            # UTF-8 bytes, so encode once instead of letting the stdlib
+            # re-encode the str internally.
             try:
-                import json
+                import orjson as _json
+            except ImportError:
+                import json as _json
 
-                release_notes_dict = json.loads(args.release_notes)
-            except json.JSONDecodeError:
-                print("❌ Invalid JSON format for release notes")
-                return
+            try:
+                release_notes_dict = _json.loads(args.release_notes.encode())
+            except ValueError:
+                print("❌ Invalid JSON format for release notes", file=sys.stderr)
+                sys.exit(1)
 
-        lane_mapping = {
-            "internal_release": FastlaneRelease.INTERNAL_RELEASE,
-            "production_release": FastlaneRelease.PRODUCTION_RELEASE,
+        config_kwargs = {
+            f.name: getattr(args, f.name) for f in fields(DeployConfig)
         }
-        lane = lane_mapping[args.lane]
-
-        config = DeployConfig(
-            # Build configuration
-            platform=args.platform,
-            framework=args.framework,
-            git_url=args.git,
-            flavor=args.flavor if args.flavor else None,
-            provisioning_profile=(
-                args.provisioning_profile if args.provisioning_profile else None
-            ),
-            branch=args.branch if args.branch else None,
-            commit_hash=args.commit_hash if args.commit_hash else None,
-            tag_name=args.tag_name if args.tag_name else None,
-            strategy=args.strategy,
-            # Deploy configuration
-            build_file_path=args.build_file_path,
-            lane=lane,
-            release_notes=release_notes_dict,
-            ios_api_key_id=args.ios_api_key_id,
-            ios_api_key_issuer_id=args.ios_api_key_issuer_id,
-            ios_api_key_path=args.ios_api_key_path,
-            ios_groups=args.ios_groups,
-            android_json_key_path=args.android_json_key_path,
-            android_package_name=args.android_package_name,
-        )
-        result = deployment(config)
-        if result:
-            print("✅ Deployment completed successfully")
+        # --release-notes arrives as a JSON string; the config wants the dict
+        config_kwargs["release_notes"] = release_notes_dict
+        config = DeployConfig(**config_kwargs)
+        if args.json:
+            import contextlib
+            import json
+
+            with contextlib.redirect_stdout(sys.stderr):
+                result = deployment(config)
+            sys.stdout.write(
+                json.dumps({"deployed": bool(result), "platform": config.platform})
+                + "\n"
+            )
+            if result:
+                print("✅ Deployment completed successfully", file=sys.stderr)
+            else:
+                print("❌ Deployment failed", file=sys.stderr)
+                sys.exit(1)
         else:
-            print("❌ Deployment failed")
+            result = deployment(config)
+            if result:
+                print("✅ Deployment completed successfully")
+            else:
+                print("❌ Deployment failed", file=sys.stderr)
+                sys.exit(1)
 
 
-# Builds the App for the specified platform and flavor.
+# Builds the App for the specified platform and flavor. Thin wrapper that
+# validates the config and keeps the CLI-facing error handling; the actual
+# pipeline lives in _build_flutter() so other entry points can reuse it.
 def build(config: BuildConfig) -> Optional[str]:
     try:
         if not config.platform:
@@ -329,124 +464,318 @@ def build(config: BuildConfig) -> Optional[str]:
             raise ValueError("❌ Git URL is required. Please specify --git.")
 
         if config.framework == "flutter":
-            # Git Processing
-            repo_name = GitManager.get_repo_name(config.git_url)
-            git_manager = GitManager(
-                repo_url=config.git_url,
-                local_path=f"./repo/{repo_name}",
+            return _build_flutter(config)
+    except Exception as e:
+        print(f"❌ An error occurred: {e}")
+        return None
+
+
+# Shared flutter build core: checkout, melos bootstrap, entry-point
+# discovery, then the platform builders. Raises on failure.
+def _build_flutter(config: BuildConfig) -> str:
+    import hashlib
+    import json
+    import shutil
+    import subprocess
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .builder import BuilderFutterIOS, BuilderFutterAndroid
+    from .git import GitManager
+    from .helper import FlutterMainFinder, FlutterMelosChecker
+
+    # Toolchain warmup: flutter precache downloads platform artifacts and is
+    # independent of the checkout, so overlap it with the clone/fetch below.
+    # Best effort only — warmup failures never fail the build.
+    warmup_thread = None
+    if shutil.which("flutter"):
+
+        def _warm_toolchain() -> None:
+            for platform in config.platform.split(","):
+                try:
+                    subprocess.run(
+                        ["flutter", "precache", f"--{platform}"],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        timeout=600,
+                    )
+                except Exception:
+                    pass
+
+        warmup_thread = threading.Thread(target=_warm_toolchain, daemon=True)
+        warmup_thread.start()
+
+    # Git Processing
+    repo_name = GitManager.get_repo_name(config.git_url)
+    if not repo_name:
+        raise ValueError(f"❌ Could not determine repository name from {config.git_url}")
+    git_manager = GitManager(
+        repo_url=config.git_url,
+        local_path=REPO_ROOT / repo_name,
+    )
+    if config.branch:
+        # Warm-run short circuit: with the preserve strategy, skip the
+        # checkout only when the local tree is clean on the requested
+        # branch AND its HEAD matches the remote tip (one ls-remote,
+        # no fetch) — a clean but stale checkout must still pull.
+        # (fresh keeps its explicit re-clone semantics.)
+        if (
+            config.strategy == "preserve"
+            and git_manager.is_clean_on_branch(config.branch)
+            and git_manager.is_synced_with_remote(config.branch)
+        ):
+            print(
+                f"ℹ️  Already clean and up to date on branch {config.branch}, skip checkout"
             )
-            if config.branch:
-                git_manager.checkout_branch(
-                    branch_name=config.branch if config.branch else "main",
-                    strategy=config.strategy,
-                )
-            elif config.commit_hash:
-                git_manager.checkout_commit(
-                    commit_hash=config.commit_hash,
-                    strategy=config.strategy,
-                )
-            elif config.tag_name:
-                git_manager.checkout_tag(
-                    tag_name=config.tag_name,
-                    strategy=config.strategy,
-                )
-            git_status = git_manager.get_status()
-            local_path = Path(git_status["local_path"])
-            if not local_path.exists():
-                raise ValueError(f"❌ The specified {local_path} does not exist.")
-
-            # Flutter Melos Checker Processing
-            checker = FlutterMelosChecker(local_path)
-            if checker.has_melos_config():
-                # Bootstrap 실행
-                success, message = checker.run_melos_bootstrap(verbose=True)
-                if not success:
-                    raise ValueError(f"❌ Melos bootstrap failed: {message}")
-
-            # Flutter Main Finder Processing
-            finder = FlutterMainFinder(f"./{local_path}", recursive_search=True)
-            finder.find_main_functions()
+        else:
+            git_manager.checkout_branch(
+                branch_name=config.branch if config.branch else "main",
+                strategy=config.strategy,
+            )
+    elif config.commit_hash:
+        git_manager.checkout_commit(
+            commit_hash=config.commit_hash,
+            strategy=config.strategy,
+        )
+    elif config.tag_name:
+        git_manager.checkout_tag(
+            tag_name=config.tag_name,
+            strategy=config.strategy,
+        )
+    git_status = git_manager.get_status()
+    local_path = Path(git_status["local_path"])
+    # get_status() already stat'ed the path; reuse its answer
+    if not git_status["local_path_exists"]:
+        raise ValueError(f"❌ The specified {local_path} does not exist.")
+
+    # Entry-point cache: re-running the same commit skips the directory walk
+    cache_file = None
+    dir_app_path = None
+    head_commit = git_status["head_commit"]
+    if head_commit:
+        cache_key = hashlib.blake2b(
+            f"{config.git_url}|{config.branch}|{head_commit}".encode()
+        ).hexdigest()
+        cache_file = REPO_ROOT / ".octopus_cache" / f"{cache_key}.json"
+        if cache_file.exists():
+            try:
+                cached = json.loads(cache_file.read_text(encoding="utf-8"))
+                cached_path = Path(cached["dir_app_path"])
+                # A stale entry (checkout moved or was re-cloned) must
+                # fall back to the walk, not fail the build forever
+                if cached_path.exists():
+                    dir_app_path = cached_path
+                    print(f"ℹ️  Using cached entry point for {head_commit[:7]}")
+                else:
+                    print("ℹ️  Cached entry point is stale, re-scanning")
+            except Exception:
+                dir_app_path = None
+
+    # The entry-point walk is independent of the melos bootstrap decision,
+    # so run it on a worker thread while the bootstrap proceeds here.
+    # (Both are blocking subprocess/file I/O, so a thread fits better
+    # than converting the pipeline to asyncio.)
+    finder = None
+    finder_future = None
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        # Flutter Main Finder Processing (background, cache miss only)
+        if dir_app_path is None:
+            finder = FlutterMainFinder(local_path, recursive_search=True)
+            finder_future = executor.submit(finder.find_main_functions)
+
+        # Flutter Melos Checker Processing: probe for a config inline and
+        # only construct the checker when one exists (the common case on
+        # non-melos repos is a couple of stat calls and no allocation)
+        if any(
+            (local_path / name).is_file() for name in FlutterMelosChecker.melos_files
+        ):
+            # Bootstrap 실행
+            success, message = FlutterMelosChecker(local_path).run_melos_bootstrap(
+                verbose=True
+            )
+            if not success:
+                raise ValueError(f"❌ Melos bootstrap failed: {message}")
+
+        if finder_future is not None:
+            finder_future.result()
             entry_points = finder.get_flutter_entry_points()
-            entry_path = (entry_points[0] if entry_points else {}).get("file", "")
-            dir_app_path = Path(f"./{local_path}/{entry_path}").parent.parent
-            if not dir_app_path.exists():
-                raise ValueError(f"❌ The specified {dir_app_path} does not exist.")
-
-            # Build Processing
-            if config.platform == "ios":
-                builder = BuilderFutterIOS(
-                    build_path=dir_app_path,
-                    flavor=config.flavor,
-                    provisioning_profile=config.provisioning_profile,
+            if not entry_points:
+                raise ValueError("❌ No Flutter entry point found.")
+            entry_path = entry_points[0]["file"]
+            # Resolve to an absolute path once; every builder subprocess
+            # (flutter/gradle/xcodebuild) then skips its own realpath work.
+            # strict=True fuses resolution with the existence check.
+            try:
+                dir_app_path = (
+                    (Path.cwd() / local_path / entry_path)
+                    .resolve(strict=True)
+                    .parent.parent
+                )
+            except FileNotFoundError:
+                raise ValueError(
+                    f"❌ The entry point {entry_path} does not exist."
                 )
-            elif config.platform == "android":
-                builder = BuilderFutterAndroid(
-                    build_path=dir_app_path,
-                    flavor=config.flavor,
-                    use_appbundle=True,
+            if cache_file:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(
+                    json.dumps(
+                        {
+                            "dir_app_path": str(dir_app_path),
+                            "entry_points": entry_points,
+                        }
+                    ),
+                    encoding="utf-8",
                 )
-            output_file_path = builder.build()
-            if not output_file_path:
-                raise ValueError(f"❌ Build failed.")
+    finally:
+        executor.shutdown(wait=True)
+    # Single stat, no extra Path round-trip
+    try:
+        os.stat(dir_app_path)
+    except FileNotFoundError:
+        raise ValueError(f"❌ The specified {dir_app_path} does not exist.")
+
+    # Let the toolchain warmup finish before the builders need it
+    if warmup_thread is not None:
+        warmup_thread.join()
+
+    # Build Processing. The Git/Melos/Finder setup above runs once
+    # even when both platforms are requested; each builder spends its
+    # time in a subprocess, so a two-thread pool overlaps them.
+    # Platform -> builder factory; adding a platform means one more entry
+    # here rather than another if/elif arm.
+    builder_factories = {
+        "ios": lambda: BuilderFutterIOS(
+            build_path=dir_app_path,
+            flavor=config.flavor,
+            provisioning_profile=config.provisioning_profile,
+        ),
+        "android": lambda: BuilderFutterAndroid(
+            build_path=dir_app_path,
+            flavor=config.flavor,
+            use_appbundle=config.use_appbundle,
+        ),
+    }
+    builders = []
+    for platform in config.platform.split(","):
+        factory = builder_factories.get(platform)
+        if factory is None:
+            raise ValueError(f"❌ Unsupported platform: {platform}")
+        builders.append(factory())
+
+    if len(builders) == 1:
+        output_file_paths = [builders[0].build()]
+    else:
+        with ThreadPoolExecutor(max_workers=len(builders)) as build_pool:
+            futures = [build_pool.submit(builder.build) for builder in builders]
+            output_file_paths = [future.result() for future in futures]
+    if not all(output_file_paths):
+        raise ValueError(f"❌ Build failed.")
+
+    return ",".join(str(path) for path in output_file_paths)
+
+
+# Deploys an .ipa to the App Store.
+def _deploy_ipa(config: DeployConfig, build_file_path: str) -> Optional[bool]:
+    from .deploy import DeployAppStore
+
+    print("📦 Deploying iOS app...")
+    deployer = DeployAppStore(
+        lane=config.lane,
+        file_path=build_file_path,
+        api_key_id=config.ios_api_key_id,
+        api_key_issuer_id=config.ios_api_key_issuer_id,
+        api_key_path=config.ios_api_key_path,
+        groups=config.ios_groups,
+        release_notes=config.release_notes,
+    )
+    return deployer.deploy()
+
+
+# Raw APKs are not deployable; only .aab is accepted for Android.
+def _reject_apk(config: DeployConfig, build_file_path: str) -> Optional[bool]:
+    print("📦 Deploying Android app...")
+    raise ValueError(
+        "❌ Unsupported Android APK deployment. Please use .aab for deployment.",
+    )
 
-            return str(output_file_path)
-    except Exception as e:
-        print(f"❌ An error occurred: {e}")
-        return None
+
+# Deploys an .aab to the Google Play Store.
+def _deploy_aab(config: DeployConfig, build_file_path: str) -> Optional[bool]:
+    from .deploy import DeployGooglePlayStore
+
+    print("📦 Deploying Android App Bundle...")
+    deployer = DeployGooglePlayStore(
+        lane=config.lane,
+        file_path=build_file_path,
+        json_key_path=config.android_json_key_path,
+        package_name=config.android_package_name,
+        release_notes=config.release_notes,
+    )
+    return deployer.deploy()
+
+
+# Build artifact suffix -> deploy handler (single hash lookup per deployment)
+_DEPLOY_DISPATCH = {
+    ".ipa": _deploy_ipa,
+    ".apk": _reject_apk,
+    ".aab": _deploy_aab,
+}
+_ALLOWED_SUFFIXES = frozenset(_DEPLOY_DISPATCH)
 
 
 def deployment(config: DeployConfig) -> Optional[bool]:
     try:
+        # Validate deploy arguments before the (potentially minutes-long) build
+        # step, so a misconfigured run fails immediately instead of afterwards.
+        if config.platform and "," in config.platform:
+            raise ValueError(
+                "❌ Deployment supports a single platform per invocation."
+            )
+        if config.build_file_path:
+            given_suffix = os.path.splitext(config.build_file_path)[1]
+            if given_suffix not in _ALLOWED_SUFFIXES:
+                raise ValueError(
+                    "❌ Unsupported file type. Only .ipa, .apk, or .aab files are allowed."
+                )
+        if config.platform == "ios":
+            if not (
+                config.ios_api_key_id
+                and config.ios_api_key_issuer_id
+                and config.ios_api_key_path
+            ):
+                raise ValueError(
+                    "❌ iOS deployment requires --ios-api-key-id, --ios-api-key-issuer-id, and --ios-api-key-path."
+                )
+        elif config.platform == "android":
+            if not (config.android_json_key_path and config.android_package_name):
+                raise ValueError(
+                    "❌ Android deployment requires --android-json-key-path and --android-package-name."
+                )
+
         # First, perform the build if build_file_path is not provided or doesn't exist
+        # (plain string ops here; Path objects are not needed for these checks)
         build_file_path = config.build_file_path
-        build_path = Path(build_file_path) if build_file_path else None
 
-        if not build_path or not build_path.exists():
+        if not build_file_path or not os.path.exists(build_file_path):
             print("🔨 Build file not found or not provided. Starting build process...")
 
-            # Extract build config and perform build
-            build_config = config.get_build_config()
-            build_result = build(build_config)
+            # DeployConfig is-a BuildConfig, so no copy is needed
+            build_result = build(config)
 
             if not build_result:
                 raise ValueError("❌ Build failed during deployment process.")
 
             build_file_path = build_result
-            build_path = Path(build_file_path)
             print(f"✅ Build completed: {build_file_path}")
 
-        if build_path.suffix not in [".ipa", ".apk", ".aab"]:
+        suffix = os.path.splitext(build_file_path)[1]
+        if suffix not in _ALLOWED_SUFFIXES:
             raise ValueError(
                 "❌ Unsupported file type. Only .ipa, .apk, or .aab files are allowed."
             )
 
-        if build_path.suffix == ".ipa":
-            print("📦 Deploying iOS app...")
-            deploy = DeployAppStore(
-                lane=config.lane,
-                file_path=str(build_path),
-                api_key_id=config.ios_api_key_id,
-                api_key_issuer_id=config.ios_api_key_issuer_id,
-                api_key_path=config.ios_api_key_path,
-                groups=config.ios_groups,
-                release_notes=config.release_notes,
-            )
-        elif build_path.suffix == ".apk":
-            print("📦 Deploying Android app...")
-            raise ValueError(
-                "❌ Unsupported Android APK deployment. Please use .aab for deployment.",
-            )
-        elif build_path.suffix == ".aab":
-            print("📦 Deploying Android App Bundle...")
-            deploy = DeployGooglePlayStore(
-                lane=config.lane,
-                file_path=str(build_path),
-                json_key_path=config.android_json_key_path,
-                package_name=config.android_package_name,
-                release_notes=config.release_notes,
-            )
-
-        return deploy.deploy()
+        return _DEPLOY_DISPATCH[suffix](config, build_file_path)
     except Exception as e:
         print(f"❌ Deployment failed: {e}")
         return False